@@ -0,0 +1,22 @@
+import os
+
+from setuptools import Extension, setup
+
+# The compiled record parser is optional: without Cython, its source or a compiler the
+# package falls back to numba or numpy at runtime.
+PYX = "src/sscm_reader/_sscm_parse.pyx"
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+if cythonize is not None and os.path.exists(PYX):
+    ext_modules = cythonize(
+        [Extension("sscm_reader._sscm_parse", [PYX], optional=True)],
+        language_level=3,
+    )
+else:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -1,11 +1,68 @@
+import numpy as np
 import pandas as pd
+import mmap
 import struct
 import os
 import glob
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from ._sscm_parse import parse as _parse_compiled
+except ImportError:
+    _parse_compiled = None
+
+# numba is only needed (and only imported) when the Cython extension is not built
+njit = None
+if _parse_compiled is None:
+    try:
+        from numba import njit
+    except ImportError:
+        pass
 
 labels = ["vehicle", "honking", "aircraft", "siren", "human",
           "bark", "bird", "church", "music", "wind", "rain"]
 
+_log = logging.getLogger(__name__)
+
+# Record layouts by entry type, including the entry type byte and timestamp
+_RECORD_DTYPES = {
+    0: np.dtype([('type', 'u1'), ('time', '<i8'), ('dba', '<f4')]),
+    1: np.dtype([('type', 'u1'), ('time', '<i8'), ('probs', '<f4', (len(labels),))]),
+    2: np.dtype([('type', 'u1'), ('time', '<i8'), ('sharpness', '<f4')]),
+    100: np.dtype([('type', 'u1'), ('time', '<i8'), ('mV', '<u2')]),
+    110: np.dtype([('type', 'u1'), ('time', '<i8')]),
+    111: np.dtype([('type', 'u1'), ('time', '<i8')]),
+    120: np.dtype([('type', 'u1'), ('time', '<i8'), ('value', '<u2')]),
+    121: np.dtype([('type', 'u1'), ('time', '<i8'), ('value', '<f4')]),
+}
+_RECORD_SIZES = {entry_type: dtype.itemsize for entry_type, dtype in _RECORD_DTYPES.items()}
+# loudness records end with an unused float, which is skipped rather than decoded
+_RECORD_SIZES[0] += 4
+
+# The same sizes indexed by entry type byte (-1 for unsupported types); the compiled
+# parsers take this table so that all parsers share one layout definition
+_SIZE_TABLE = np.full(256, -1, dtype=np.int64)
+_SIZE_TABLE[list(_RECORD_SIZES)] = list(_RECORD_SIZES.values())
+_SIZE_TABLE.flags.writeable = False
+
+# Timestamp column of each output frame in the parsed column arrays
+_FRAME_TIMES = {
+    'loudness': 'loudness_time',
+    'sharpness': 'sharpness_time',
+    'source': 'source_time',
+    'voltage': 'voltage_time',
+    'event_log': 'event_time',
+}
+
+_EVENT_NAMES = {
+    110: "TIME_FROM_NTP",
+    111: "TIME_FROM_RTC",
+    120: "ENTER_SLEEP",
+    121: "NIGHTLY_PD",
+}
+
 
 def read_header(f):
     """
@@ -52,6 +109,268 @@ def read_header(f):
     return format_version, file_created_ts, sensor_name, num_source_classes
 
 
+def _record_error(buf, off, path):
+    """Builds the exception for the unreadable record starting at byte offset off."""
+    if off < len(buf) and buf[off] not in _RECORD_DTYPES:
+        entry_type = buf[off]
+        if off + 9 <= len(buf):
+            with memoryview(buf) as mv:
+                time_ms = int.from_bytes(mv[off + 1:off + 9], 'little', signed=True)
+            _log.error("Path: %s, Entry type: %d, Time: %d (%s)",
+                       path, entry_type, time_ms, pd.to_datetime(time_ms, unit='ms'))
+        return RuntimeError('Invalid entry type: ' + str(entry_type))
+    return RuntimeError(f'Truncated record at end of file: {path}')
+
+
+def _scan_offsets(buf, off, path):
+    """
+    Walks the record stream of an SSCM file without decoding it.
+
+    Args:
+        buf: Buffer holding the whole SSCM file
+        off (int): Byte offset of the first record, right after the header
+        path (str): Path of the file, used in error messages
+
+    Returns:
+        dict: Byte offsets (np.ndarray of int64) of the records of each entry type
+
+    Raises:
+        RuntimeError: If an unsupported entry type is encountered or the last record is truncated
+    """
+    offsets = {entry_type: [] for entry_type in _RECORD_DTYPES}
+    file_size = len(buf)
+    while off < file_size:
+        # optional sync marker, peeked without slicing
+        if buf[off] == 0xff and off + 1 < file_size and buf[off + 1] == 0xff:
+            off += 2
+        if off >= file_size or buf[off] not in offsets:
+            raise _record_error(buf, off, path)
+        entry_type = buf[off]
+        offsets[entry_type].append(off)
+        off += _RECORD_SIZES[entry_type]
+        if off > file_size:
+            raise _record_error(buf, off - _RECORD_SIZES[entry_type], path)
+    return {entry_type: np.asarray(o, dtype=np.int64) for entry_type, o in offsets.items()}
+
+
+def _gather(raw, offsets, dtype):
+    """Copies the records starting at the given byte offsets into a structured array."""
+    idx = offsets[:, None] + np.arange(dtype.itemsize)
+    return raw[idx].view(dtype).ravel()
+
+
+def _parse_numpy(buf, start, path):
+    """
+    Decodes all records of a mapped SSCM file with numpy.
+
+    Args:
+        buf: Buffer holding the whole SSCM file
+        start (int): Byte offset of the first record, right after the header
+        path (str): Path of the file, used in error messages
+
+    Returns:
+        dict: Column arrays of all record types, see _parse_records
+    """
+    offsets = _scan_offsets(buf, start, path)
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    records = {entry_type: _gather(raw, offsets[entry_type], dtype)
+               for entry_type, dtype in _RECORD_DTYPES.items()}
+
+    # events are rare, so they are merged back into file order afterwards
+    event_offsets = np.concatenate([offsets[entry_type] for entry_type in _EVENT_NAMES])
+    order = np.argsort(event_offsets, kind='stable')
+    event_type = np.concatenate([records[entry_type]['type'] for entry_type in _EVENT_NAMES])
+    event_time = np.concatenate([records[entry_type]['time'] for entry_type in _EVENT_NAMES])
+    event_value = np.concatenate([
+        records[entry_type]['value'].astype(np.float64)
+        if 'value' in records[entry_type].dtype.names
+        else np.zeros(len(records[entry_type]))
+        for entry_type in _EVENT_NAMES])
+
+    return {
+        'loudness_time': records[0]['time'],
+        'dba': records[0]['dba'],
+        'source_time': records[1]['time'],
+        'source_probs': records[1]['probs'],
+        'sharpness_time': records[2]['time'],
+        'sharpness': records[2]['sharpness'],
+        'voltage_time': records[100]['time'],
+        'mV': records[100]['mV'],
+        'event_time': event_time[order],
+        'event_type': event_type[order],
+        'event_value': event_value[order],
+    }
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _load_i64(buf, i):
+        value = np.int64(0)
+        for k in range(8):
+            value |= np.int64(buf[i + k]) << (8 * k)
+        return value
+
+    @njit(cache=True)
+    def _load_u16(buf, i):
+        return np.uint16(buf[i]) | (np.uint16(buf[i + 1]) << 8)
+
+    @njit(cache=True)
+    def _load_u32(buf, i):
+        return (np.uint32(buf[i]) | (np.uint32(buf[i + 1]) << 8)
+                | (np.uint32(buf[i + 2]) << 16) | (np.uint32(buf[i + 3]) << 24))
+
+    @njit(cache=True)
+    def _load_f32(buf, i, bits, bits_f32):
+        # bits is a reusable one-element uint32 array and bits_f32 its float32 view,
+        # which reinterprets the byte-assembled integer without slicing buf
+        bits[0] = _load_u32(buf, i)
+        return bits_f32[0]
+
+    @njit(cache=True)
+    def _scan_counts(buf, start, sizes):
+        """Counts the records of each type; err is the offset of the first unreadable record or -1."""
+        size = buf.shape[0]
+        n_loud = n_source = n_sharp = n_volt = n_event = 0
+        off = start
+        err = -1
+        while off < size:
+            if off + 1 < size and buf[off] == 0xff and buf[off + 1] == 0xff:
+                off += 2
+            if off >= size:
+                err = off
+                break
+            entry_type = buf[off]
+            rec_size = sizes[entry_type]
+            if rec_size < 0 or off + rec_size > size:
+                err = off
+                break
+            if entry_type == 0:
+                n_loud += 1
+            elif entry_type == 1:
+                n_source += 1
+            elif entry_type == 2:
+                n_sharp += 1
+            elif entry_type == 100:
+                n_volt += 1
+            else:
+                n_event += 1
+            off += rec_size
+        return err, n_loud, n_source, n_sharp, n_volt, n_event
+
+    @njit(cache=True)
+    def _fill_columns(buf, start, sizes, loudness_time, dba, source_time, source_probs,
+                      sharpness_time, sharpness, voltage_time, mV,
+                      event_time, event_type, event_value):
+        """Decodes a record stream validated by _scan_counts into preallocated columns."""
+        size = buf.shape[0]
+        n_classes = source_probs.shape[1]
+        bits = np.empty(1, np.uint32)
+        bits_f32 = bits.view(np.float32)
+        i_loud = i_source = i_sharp = i_volt = i_event = 0
+        off = start
+        while off < size:
+            if buf[off] == 0xff and buf[off + 1] == 0xff:
+                off += 2
+            entry_type = buf[off]
+            time_ms = _load_i64(buf, off + 1)
+            if entry_type == 0:
+                loudness_time[i_loud] = time_ms
+                dba[i_loud] = _load_f32(buf, off + 9, bits, bits_f32)
+                i_loud += 1
+            elif entry_type == 1:
+                source_time[i_source] = time_ms
+                for k in range(n_classes):
+                    source_probs[i_source, k] = _load_f32(buf, off + 9 + 4 * k, bits, bits_f32)
+                i_source += 1
+            elif entry_type == 2:
+                sharpness_time[i_sharp] = time_ms
+                sharpness[i_sharp] = _load_f32(buf, off + 9, bits, bits_f32)
+                i_sharp += 1
+            elif entry_type == 100:
+                voltage_time[i_volt] = time_ms
+                mV[i_volt] = _load_u16(buf, off + 9)
+                i_volt += 1
+            else:
+                event_time[i_event] = time_ms
+                event_type[i_event] = entry_type
+                if entry_type == 120:
+                    event_value[i_event] = _load_u16(buf, off + 9)
+                elif entry_type == 121:
+                    event_value[i_event] = _load_f32(buf, off + 9, bits, bits_f32)
+                else:
+                    event_value[i_event] = 0.0
+                i_event += 1
+            off += sizes[entry_type]
+else:
+    _scan_counts = _fill_columns = None
+
+
+def _parse_numba(buf, start, path):
+    """Decodes all records of a mapped SSCM file with the compiled kernels, see _parse_numpy."""
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    err, n_loud, n_source, n_sharp, n_volt, n_event = _scan_counts(raw, start, _SIZE_TABLE)
+    if err >= 0:
+        # release the buffer export so the caller can close the mmap
+        del raw
+        raise _record_error(buf, err, path)
+
+    columns = {
+        'loudness_time': np.empty(n_loud, '<i8'),
+        'dba': np.empty(n_loud, '<f4'),
+        'source_time': np.empty(n_source, '<i8'),
+        'source_probs': np.empty((n_source, len(labels)), '<f4'),
+        'sharpness_time': np.empty(n_sharp, '<i8'),
+        'sharpness': np.empty(n_sharp, '<f4'),
+        'voltage_time': np.empty(n_volt, '<i8'),
+        'mV': np.empty(n_volt, '<u2'),
+        'event_time': np.empty(n_event, '<i8'),
+        'event_type': np.empty(n_event, 'u1'),
+        'event_value': np.empty(n_event, '<f8'),
+    }
+    _fill_columns(raw, start, _SIZE_TABLE, *columns.values())
+    return columns
+
+
+def _parse_cython(buf, start, path):
+    """Decodes all records of a mapped SSCM file with the Cython extension, see _parse_numpy."""
+    err, columns = _parse_compiled(buf, start, _SIZE_TABLE, len(labels))
+    if err >= 0:
+        raise _record_error(buf, err, path)
+    return columns
+
+
+def _parse_records(buf, start, path):
+    """
+    Decodes all records of a mapped SSCM file into column arrays.
+
+    Uses the compiled Cython extension if it was built, else the numba kernels if numba
+    is installed, and falls back to numpy otherwise.
+
+    Args:
+        buf: Buffer holding the whole SSCM file
+        start (int): Byte offset of the first record, right after the header
+        path (str): Path of the file, used in error messages
+
+    Returns:
+        dict: Column arrays keyed 'loudness_time', 'dba', 'source_time', 'source_probs',
+            'sharpness_time', 'sharpness', 'voltage_time', 'mV', 'event_time',
+            'event_type' and 'event_value', with times in ms
+
+    Raises:
+        RuntimeError: If an unsupported entry type is encountered or the last record is truncated
+    """
+    if _parse_compiled is not None:
+        return _parse_cython(buf, start, path)
+    if _fill_columns is not None:
+        return _parse_numba(buf, start, path)
+    return _parse_numpy(buf, start, path)
+
+
+def _frame(columns):
+    """Builds a DataFrame from a dict of equally long column arrays without copying them."""
+    return pd.DataFrame(columns, copy=False)
+
+
 def read_sscm(path, add_tz_hours=None):
     """
     Reads one SSCM file and returns its content as DataFrames.
@@ -69,104 +388,149 @@ def read_sscm(path, add_tz_hours=None):
             - sensor_name (str): Name of the sensor that created the file
             - loudness (pd.DataFrame): Loudness measurements with columns ['time', 'dba', 'spl_a']
             - sharpness (pd.DataFrame): Sharpness values with columns ['time', 'sharpness']
-            - source (pd.DataFrame): Sound source classifications with time and probability columns
+            - source (pd.DataFrame): Sound source classifications with time, probability and categorical 'label' columns
             - voltage (pd.DataFrame): Voltage readings with columns ['time', 'mV']
             - event_log (pd.DataFrame): System events with columns ['time', 'event', 'event value']
 
     Raises:
         RuntimeError: If file format is invalid or unsupported entry type is encountered
     """
-    loudness = []
-    sharpness = []
-    source = []
-    voltage = []
-    event_log = []
-
-    f = open(path, mode="rb")
-    f.seek(0, 2)
-    file_size = f.tell()
-    f.seek(0)
-    format_version, file_created_ts, sensor_name, num_source_classes = read_header(
-        f)
-    while f.tell() < file_size:
-        block = f.read(2)
-        if (block != b'\xff\xff'):
-            f.seek(f.tell()-2)
-        entry_type = struct.unpack('B', f.read(1))[0]
-        time_ms = struct.unpack('q', f.read(8))[0]
-        if entry_type == 0:
-            dba = struct.unpack('f', f.read(4))[0]
-            _ = struct.unpack('f', f.read(4))[0]
-            # convert to linear SPL
-            try:
-                spl_a = 10 ** (dba / 10)
-                loudness.append([time_ms, dba, spl_a])
-            except Exception as e:
-                print(f"Error converting dBA to SPL after {len(loudness)} entries")
-                print(f"Entry type: {entry_type}, Time: {time_ms} ({pd.to_datetime(time_ms, unit='ms')}), dBA: {dba}")
-        elif entry_type == 1:
-            s = [time_ms]
-            for _ in range(num_source_classes):
-                s.append(struct.unpack('f', f.read(4))[0])
-            source.append(s)
-        elif entry_type == 2:
-            sharp = struct.unpack('f', f.read(4))[0]
-            sharpness.append([time_ms, sharp])
-        elif entry_type == 100:
-            mV = struct.unpack('H', f.read(2))[0]
-            voltage.append([time_ms, mV])
-        elif entry_type == 110:
-            event_log.append([time_ms, "TIME_FROM_NTP", 0])
-            pass
-        elif entry_type == 111:
-            event_log.append([time_ms, "TIME_FROM_RTC", 0])
-            pass
-        elif entry_type == 120:
-            seconds = struct.unpack('H', f.read(2))[0]
-            event_log.append([time_ms, "ENTER_SLEEP", seconds])
-            pass
-        elif entry_type == 121:
-            sampling_rate = struct.unpack('f', f.read(4))[0]
-            event_log.append([time_ms, "NIGHTLY_PD", sampling_rate])
-            pass
-        else:
-            print(f"Path: {path}, Entry type: {entry_type}, Time: {time_ms} ({pd.to_datetime(time_ms, unit='ms')})")
-            raise RuntimeError('Invalid entry type: ' + str(entry_type))
-
-    loudness = pd.DataFrame(loudness, columns=['time', 'dba', 'spl_a'])
-    loudness['time'] = pd.to_datetime(loudness['time'], unit='ms')
-    sharpness = pd.DataFrame(sharpness, columns=['time', 'sharpness'])
-    sharpness['time'] = pd.to_datetime(sharpness['time'], unit='ms')
-    source_columns = ['time']
-    source_columns.extend(labels)
-    source = pd.DataFrame(source, columns=source_columns)
-    source['time'] = pd.to_datetime(source['time'], unit='ms')
-    source['label'] = source.iloc[:, 1:].idxmax(axis=1)
-    voltage = pd.DataFrame(voltage, columns=['time', 'mV'])
-    voltage['time'] = pd.to_datetime(voltage['time'], unit='ms')
-    event_log = pd.DataFrame(event_log, columns=['time', 'event', 'value'])
-    event_log['time'] = pd.to_datetime(event_log['time'], unit='ms')
+    sensor_name, columns = _read_columns(path, add_tz_hours)
+    return sensor_name, *_frames(columns)
+
+
+def _read_columns(path, add_tz_hours=None):
+    """Reads one SSCM file into the column arrays of _parse_records, with timezone applied."""
+    with open(path, mode="rb") as f:
+        format_version, file_created_ts, sensor_name, num_source_classes = read_header(
+            f)
+        start = f.tell()
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        columns = _parse_records(buf, start, path)
+    finally:
+        buf.close()
 
     if add_tz_hours:
-        loudness['time'] = loudness['time'] + pd.DateOffset(hours=add_tz_hours)
-        sharpness['time'] = sharpness['time'] + \
-            pd.DateOffset(hours=add_tz_hours)
-        source['time'] = source['time'] + pd.DateOffset(hours=add_tz_hours)
-        voltage['time'] = voltage['time'] + pd.DateOffset(hours=add_tz_hours)
-        event_log['time'] = event_log['time'] + \
-            pd.DateOffset(hours=add_tz_hours)
+        tz_offset_ms = round(add_tz_hours * 3_600_000)
+        for key in _FRAME_TIMES.values():
+            columns[key] += tz_offset_ms
+    return sensor_name, columns
+
+
+def _spl_a(dba):
+    """Converts dBA levels to linear SPL, 10 ** (dba / 10), as a single exp over the array."""
+    spl_a = np.multiply(dba, np.log(10.0) / 10, dtype=np.float64)
+    with np.errstate(over='ignore'):
+        np.exp(spl_a, out=spl_a)
+    return spl_a
+
+
+def _frames(columns, extra=None):
+    """
+    Builds the output DataFrames from parsed column arrays.
+
+    Args:
+        columns (dict): Column arrays as returned by _parse_records
+        extra (dict, optional): Additional columns to append, keyed by frame name (see _FRAME_TIMES)
 
-    return sensor_name, loudness, sharpness, source, voltage, event_log
+    Returns:
+        tuple: (loudness, sharpness, source, voltage, event_log)
+    """
+    extra = extra or {}
+    loudness = _frame({'time': columns['loudness_time'].view('datetime64[ms]'),
+                       'dba': columns['dba'],
+                       'spl_a': _spl_a(columns['dba']),
+                       **extra.get('loudness', {})})
+    sharpness = _frame({'time': columns['sharpness_time'].view('datetime64[ms]'),
+                        'sharpness': columns['sharpness'],
+                        **extra.get('sharpness', {})})
+    probs = columns['source_probs']
+    source = {'time': columns['source_time'].view('datetime64[ms]')}
+    for i, label in enumerate(labels):
+        source[label] = probs[:, i]
+    source['label'] = pd.Categorical.from_codes(
+        probs.argmax(axis=1).astype(np.int8), categories=labels)
+    source = _frame({**source, **extra.get('source', {})})
+    voltage = _frame({'time': columns['voltage_time'].view('datetime64[ms]'),
+                      'mV': columns['mV'].astype(np.int64),
+                      **extra.get('voltage', {})})
+    event_log = _frame({'time': columns['event_time'].view('datetime64[ms]'),
+                        'event': pd.Series(columns['event_type']).map(_EVENT_NAMES).array,
+                        'value': columns['event_value'],
+                        **extra.get('event_log', {})})
+    return loudness, sharpness, source, voltage, event_log
+
+
+def _read_sscm_file(file_path, add_tz_hours):
+    """Worker for read_sscm_folder: reads one file into column arrays."""
+    return _read_columns(file_path, add_tz_hours)
+
+
+def _merge_columns(results, basenames):
+    """
+    Concatenates the column arrays of several files into one set of output frames.
+
+    The column dicts in results are emptied while merging to keep peak memory low.
 
+    Args:
+        results (list): (sensor_name, columns) per file, in file order
+        basenames (list): File name per result, used for the 'filename' column
 
-def read_sscm_folder(folder_path, add_tz_hours=None):
+    Returns:
+        tuple: (loudness, sharpness, source, voltage, event_log) with 'filename' and
+            'sensor_id' Categorical columns
+    """
+    sensor_names = [sensor_name for sensor_name, _ in results]
+    sensor_categories = list(dict.fromkeys(sensor_names))
+    sensor_codes = [sensor_categories.index(name) for name in sensor_names]
+    file_codes = np.arange(len(results))
+    extra = {}
+    for frame, time_key in _FRAME_TIMES.items():
+        counts = [len(columns[time_key]) for _, columns in results]
+        extra[frame] = {
+            'filename': pd.Categorical.from_codes(
+                np.repeat(file_codes, counts), categories=basenames),
+            'sensor_id': pd.Categorical.from_codes(
+                np.repeat(sensor_codes, counts), categories=sensor_categories),
+        }
+
+    # Concatenate one column at a time and drop the per-file pieces right away, so
+    # only the column being merged is held twice; _frames then uses the merged arrays
+    # as frame columns without copying them
+    merged = {}
+    for key in list(results[0][1]):
+        merged[key] = np.concatenate([columns.pop(key) for _, columns in results])
+    return _frames(merged, extra)
+
+
+def _sort_by_time(df):
+    """
+    Sorts a merged frame by time.
+
+    The pieces of every file are already in time order, so a stable (merge) sort only
+    has to merge those runs, and nothing is reordered if the files do not overlap.
+    """
+    times = df['time'].to_numpy()
+    if (times[1:] >= times[:-1]).all():
+        return df
+    return df.take(np.argsort(times, kind='stable')).reset_index(drop=True)
+
+
+def read_sscm_folder(folder_path, add_tz_hours=None, max_workers=None):
     """
     Reads all SSCM files from a folder and merges them into one dataframe.
     Can be used to read all SSCM files of one sensor at once.
+    Files are parsed in parallel worker processes, unless max_workers is 1, the folder
+    holds a single file, or the caller is itself a daemonic process (e.g. a
+    multiprocessing.Pool worker); then they are parsed one by one in this process.
 
     Parameters:
     folder_path (str): Path to the folder containing SSCM files
     add_tz_hours (int, optional): Hours to add for timezone adjustment
+    max_workers (int, optional): Number of worker processes, defaults to the number of CPUs;
+        1 reads the files serially without starting any process
 
     Returns:
         tuple: (sensor_names, merged_loudness, merged_sharpness, merged_sources, merged_voltage, merged_event_log)
@@ -175,88 +539,73 @@ def read_sscm_folder(folder_path, add_tz_hours=None):
     sscm_files = glob.glob(os.path.join(folder_path, "*.sscm"))
 
     if not sscm_files:
-        print(f"No SSCM files found in folder: {folder_path}")
+        _log.warning("No SSCM files found in folder: %s", folder_path)
         return None, None, None, None, None, None
 
-    print(f"Found {len(sscm_files)} SSCM files to process")
-
-    # Initialize lists to store merged data
-    all_loudness = []
-    all_sharpness = []
-    all_sources = []
-    all_voltage = []
-    all_event_log = []
-    sensor_names = []
-
-    for file_path in sorted(sscm_files):
-        try:
-            print(f"Processing file: {os.path.basename(file_path)}")
-            sensor_name, loudness, sharpness, sources, voltage, event_log = read_sscm(
-                file_path, add_tz_hours)
-
-            # Add filename and sensor info to each dataframe
-            loudness['filename'] = os.path.basename(file_path)
-            loudness['sensor_id'] = sensor_name
-            sharpness['filename'] = os.path.basename(file_path)
-            sharpness['sensor_id'] = sensor_name
-            sources['filename'] = os.path.basename(file_path)
-            sources['sensor_id'] = sensor_name
-            voltage['filename'] = os.path.basename(file_path)
-            voltage['sensor_id'] = sensor_name
-            event_log['filename'] = os.path.basename(file_path)
-            event_log['sensor_id'] = sensor_name
-
-            # Append to lists
-            all_loudness.append(loudness)
-            all_sharpness.append(sharpness)
-            all_sources.append(sources)
-            all_voltage.append(voltage)
-            all_event_log.append(event_log)
-            sensor_names.append(sensor_name)
-
-        except Exception as e:
-            print(f"Error processing file {file_path}: {str(e)}")
-            continue
-
-    # Merge all dataframes
+    _log.info("Found %d SSCM files to process", len(sscm_files))
+
+    sscm_files = sorted(sscm_files)
+    basenames = [os.path.basename(file_path) for file_path in sscm_files]
+    results = [None] * len(sscm_files)
+    # daemonic processes (e.g. multiprocessing.Pool workers) cannot start a pool
+    serial = (max_workers == 1 or len(sscm_files) == 1
+              or multiprocessing.current_process().daemon)
+    if serial:
+        for i, file_path in enumerate(sscm_files):
+            _log.debug("Processing file: %s", basenames[i])
+            try:
+                results[i] = _read_sscm_file(file_path, add_tz_hours)
+            except Exception as e:
+                _log.error("Error processing file %s: %s", file_path, e)
+    else:
+        # progress is logged here, as spawned workers have no logging configuration
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_read_sscm_file, file_path, add_tz_hours): i
+                       for i, file_path in enumerate(sscm_files)}
+            for future in as_completed(futures):
+                i = futures[future]
+                _log.debug("Processed file: %s", basenames[i])
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    _log.error("Error processing file %s: %s", sscm_files[i], e)
+
+    # Collect results in file order
+    parsed = [(basename, result) for basename, result in zip(basenames, results)
+              if result is not None]
+    sensor_names = [sensor_name for _, (sensor_name, _) in parsed]
+
+    # Merge all files
     try:
-        merged_loudness = pd.concat(
-            all_loudness, ignore_index=True) if all_loudness else pd.DataFrame()
-        merged_sharpness = pd.concat(
-            all_sharpness, ignore_index=True) if all_sharpness else pd.DataFrame()
-        merged_sources = pd.concat(
-            all_sources, ignore_index=True) if all_sources else pd.DataFrame()
-        merged_voltage = pd.concat(
-            all_voltage, ignore_index=True) if all_voltage else pd.DataFrame()
-        merged_event_log = pd.concat(
-            all_event_log, ignore_index=True) if all_event_log else pd.DataFrame()
+        if parsed:
+            merged_loudness, merged_sharpness, merged_sources, merged_voltage, merged_event_log = _merge_columns(
+                [result for _, result in parsed],
+                [basename for basename, _ in parsed])
+        else:
+            merged_loudness, merged_sharpness, merged_sources, merged_voltage, merged_event_log = (
+                pd.DataFrame() for _ in range(5))
 
         # Sort by time
         if not merged_loudness.empty:
-            merged_loudness = merged_loudness.sort_values(
-                'time').reset_index(drop=True)
+            merged_loudness = _sort_by_time(merged_loudness)
         if not merged_sharpness.empty:
-            merged_sharpness = merged_sharpness.sort_values(
-                'time').reset_index(drop=True)
+            merged_sharpness = _sort_by_time(merged_sharpness)
         if not merged_sources.empty:
-            merged_sources = merged_sources.sort_values(
-                'time').reset_index(drop=True)
+            merged_sources = _sort_by_time(merged_sources)
         if not merged_voltage.empty:
-            merged_voltage = merged_voltage.sort_values(
-                'time').reset_index(drop=True)
+            merged_voltage = _sort_by_time(merged_voltage)
         if not merged_event_log.empty:
-            merged_event_log = merged_event_log.sort_values(
-                'time').reset_index(drop=True)
+            merged_event_log = _sort_by_time(merged_event_log)
 
-        print(f"Successfully merged data from {len(sensor_names)} files")
-        print(f"Total loudness records: {len(merged_loudness)}")
-        print(f"Total sharpness records: {len(merged_sharpness)}")
-        print(f"Total source records: {len(merged_sources)}")
-        print(f"Total voltage records: {len(merged_voltage)}")
-        print(f"Total event log records: {len(merged_event_log)}")
+        _log.info("Successfully merged data from %d files", len(sensor_names))
+        _log.info("Total loudness records: %d", len(merged_loudness))
+        _log.info("Total sharpness records: %d", len(merged_sharpness))
+        _log.info("Total source records: %d", len(merged_sources))
+        _log.info("Total voltage records: %d", len(merged_voltage))
+        _log.info("Total event log records: %d", len(merged_event_log))
 
         return sensor_names, merged_loudness, merged_sharpness, merged_sources, merged_voltage, merged_event_log
 
     except Exception as e:
-        print(f"Error merging dataframes: {str(e)}")
+        _log.exception("Error merging dataframes: %s", e)
         return None, None, None, None, None, None
@@ -0,0 +1,136 @@
+# cython: language_level=3
+"""
+Compiled SSCM record parser.
+
+Counts the records of a mapped SSCM file, then decodes them into preallocated
+column arrays. Returns the same columns as the numba and numpy parsers in
+sscm_reader._parse_records, which falls back to those if this module is not built.
+"""
+cimport cython
+from libc.stdint cimport int64_t, uint16_t
+from libc.string cimport memcpy
+
+import numpy as np
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def parse(const unsigned char[::1] buf, Py_ssize_t start, const int64_t[::1] sizes,
+          Py_ssize_t n_classes):
+    """
+    Decodes all records of an SSCM file.
+
+    Args:
+        buf: Buffer holding the whole SSCM file
+        start (int): Byte offset of the first record, right after the header
+        sizes: Record size by entry type byte (256 entries, -1 if unsupported),
+            sscm_reader._SIZE_TABLE
+        n_classes (int): Number of source classes per source record
+
+    Returns:
+        tuple: (err, columns) where err is the offset of the first unreadable record or -1,
+            and columns the dict of column arrays (None if err >= 0)
+    """
+    cdef Py_ssize_t size = buf.shape[0]
+    cdef Py_ssize_t off = start
+    cdef Py_ssize_t err = -1
+    cdef Py_ssize_t rec_size
+    cdef Py_ssize_t n_loud = 0, n_source = 0, n_sharp = 0, n_volt = 0, n_event = 0
+    cdef Py_ssize_t i_loud = 0, i_source = 0, i_sharp = 0, i_volt = 0, i_event = 0
+    cdef unsigned char entry_type
+    cdef int64_t time_ms
+    cdef uint16_t u16
+    cdef float f32
+
+    # first pass: count the records of each type and validate the stream
+    with nogil:
+        while off < size:
+            if off + 1 < size and buf[off] == 0xff and buf[off + 1] == 0xff:
+                off += 2
+            if off >= size:
+                err = off
+                break
+            entry_type = buf[off]
+            rec_size = sizes[entry_type]
+            if rec_size < 0 or off + rec_size > size:
+                err = off
+                break
+            if entry_type == 0:
+                n_loud += 1
+            elif entry_type == 1:
+                n_source += 1
+            elif entry_type == 2:
+                n_sharp += 1
+            elif entry_type == 100:
+                n_volt += 1
+            else:
+                n_event += 1
+            off += rec_size
+    if err >= 0:
+        return err, None
+
+    columns = {
+        'loudness_time': np.empty(n_loud, '<i8'),
+        'dba': np.empty(n_loud, '<f4'),
+        'source_time': np.empty(n_source, '<i8'),
+        'source_probs': np.empty((n_source, n_classes), '<f4'),
+        'sharpness_time': np.empty(n_sharp, '<i8'),
+        'sharpness': np.empty(n_sharp, '<f4'),
+        'voltage_time': np.empty(n_volt, '<i8'),
+        'mV': np.empty(n_volt, '<u2'),
+        'event_time': np.empty(n_event, '<i8'),
+        'event_type': np.empty(n_event, 'u1'),
+        'event_value': np.empty(n_event, '<f8'),
+    }
+    cdef int64_t[::1] loudness_time = columns['loudness_time']
+    cdef float[::1] dba = columns['dba']
+    cdef int64_t[::1] source_time = columns['source_time']
+    cdef float[:, ::1] source_probs = columns['source_probs']
+    cdef int64_t[::1] sharpness_time = columns['sharpness_time']
+    cdef float[::1] sharpness = columns['sharpness']
+    cdef int64_t[::1] voltage_time = columns['voltage_time']
+    cdef uint16_t[::1] mV = columns['mV']
+    cdef int64_t[::1] event_time = columns['event_time']
+    cdef unsigned char[::1] event_type = columns['event_type']
+    cdef double[::1] event_value = columns['event_value']
+
+    # second pass: decode into the preallocated columns; fields are unaligned, so they are
+    # copied with memcpy (plain loads), assuming a little-endian host like the sensor
+    off = start
+    with nogil:
+        while off < size:
+            if buf[off] == 0xff and buf[off + 1] == 0xff:
+                off += 2
+            entry_type = buf[off]
+            memcpy(&time_ms, &buf[off + 1], 8)
+            if entry_type == 0:
+                loudness_time[i_loud] = time_ms
+                memcpy(&dba[i_loud], &buf[off + 9], 4)
+                i_loud += 1
+            elif entry_type == 1:
+                source_time[i_source] = time_ms
+                memcpy(&source_probs[i_source, 0], &buf[off + 9], 4 * n_classes)
+                i_source += 1
+            elif entry_type == 2:
+                sharpness_time[i_sharp] = time_ms
+                memcpy(&sharpness[i_sharp], &buf[off + 9], 4)
+                i_sharp += 1
+            elif entry_type == 100:
+                voltage_time[i_volt] = time_ms
+                memcpy(&mV[i_volt], &buf[off + 9], 2)
+                i_volt += 1
+            else:
+                event_time[i_event] = time_ms
+                event_type[i_event] = entry_type
+                if entry_type == 120:
+                    memcpy(&u16, &buf[off + 9], 2)
+                    event_value[i_event] = u16
+                elif entry_type == 121:
+                    memcpy(&f32, &buf[off + 9], 4)
+                    event_value[i_event] = f32
+                else:
+                    event_value[i_event] = 0.0
+                i_event += 1
+            off += sizes[entry_type]
+
+    return -1, columns